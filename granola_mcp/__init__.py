@@ -8,12 +8,25 @@ JSON cache files using 100% native Python with no external dependencies.
 __version__ = "0.1.0"
 __author__ = "GranolaMCP Team"
 
-from .core.parser import GranolaParser
-from .core.meeting import Meeting
-from .core.transcript import Transcript
+import importlib
+
+# Public classes are imported on first access so that importing a
+# lightweight submodule (e.g. granola_mcp.utils.config) stays cheap.
+_LAZY_IMPORTS = {
+    "GranolaParser": ".core.parser",
+    "Meeting": ".core.meeting",
+    "Transcript": ".core.transcript",
+}
 
 __all__ = [
     "GranolaParser",
     "Meeting",
     "Transcript",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -5,15 +5,29 @@ Contains the main classes and utilities for parsing and processing
 Granola.ai meeting data.
 """
 
-from .parser import GranolaParser
-from .meeting import Meeting
-from .transcript import Transcript
+import importlib
+
 from .timezone_utils import convert_utc_to_cst, get_cst_timezone
 
+# Heavier classes are imported on first access so that importing
+# timezone_utils alone does not pull in the parser and meeting models.
+_LAZY_IMPORTS = {
+    "GranolaParser": ".parser",
+    "Meeting": ".meeting",
+    "Transcript": ".transcript",
+}
+
 __all__ = [
     "GranolaParser",
     "Meeting",
     "Transcript",
     "convert_utc_to_cst",
     "get_cst_timezone",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
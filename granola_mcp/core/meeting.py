@@ -10,12 +10,54 @@ from typing import Dict, Any, List, Optional
 from .timezone_utils import convert_utc_to_cst
 from .transcript import Transcript
 
+# Sentinel for cached fields that have not been computed yet (None is a valid value)
+_UNSET: Any = object()
+
+
+def extract_end_time(meeting_data: Dict[str, Any]) -> Optional[datetime.datetime]:
+    """
+    Extract a meeting's end time in CST from raw meeting data.
+
+    Shared by Meeting.end_time and callers that filter raw cache data
+    without building Meeting objects.
+
+    Args:
+        meeting_data: Raw meeting data dictionary from cache
+
+    Returns:
+        Optional[datetime.datetime]: End time in CST, or None if not found
+    """
+    # Try different possible end time fields
+    for time_field in ['end_time', 'endTime', 'finished_at']:
+        if time_field in meeting_data:
+            try:
+                return convert_utc_to_cst(meeting_data[time_field])
+            except (ValueError, TypeError):
+                continue
+
+    # Handle Google Calendar format: end.dateTime
+    if 'end' in meeting_data and isinstance(meeting_data['end'], dict):
+        end_data = meeting_data['end']
+        if 'dateTime' in end_data:
+            try:
+                return convert_utc_to_cst(end_data['dateTime'])
+            except (ValueError, TypeError):
+                pass
+
+    return None
+
 
 class Meeting:
     """
     Represents a single Granola.ai meeting with its metadata and content.
+
+    Frequently accessed fields (id, title, start/end time, transcript) are
+    extracted from the raw data on first access and cached, so repeated
+    reads are plain attribute loads.
     """
 
+    __slots__ = ('_data', '_id', '_title', '_start_time', '_end_time', '_transcript')
+
     def __init__(self, meeting_data: Dict[str, Any]):
         """
         Initialize a Meeting object from raw meeting data.
@@ -24,11 +66,21 @@ class Meeting:
             meeting_data: Raw meeting data dictionary from cache
         """
         self._data = meeting_data
-        self._transcript: Optional[Transcript] = None
+        self._id: Optional[str] = _UNSET
+        self._title: Optional[str] = _UNSET
+        self._start_time: Optional[datetime.datetime] = _UNSET
+        self._end_time: Optional[datetime.datetime] = _UNSET
+        self._transcript: Optional[Transcript] = _UNSET
 
     @property
     def id(self) -> Optional[str]:
         """Get the meeting ID."""
+        if self._id is _UNSET:
+            self._id = self._find_id()
+        return self._id
+
+    def _find_id(self) -> Optional[str]:
+        """Extract the meeting ID from the raw data."""
         # Try different possible ID fields
         for id_field in ['id', 'meeting_id', 'session_id', 'uuid']:
             if id_field in self._data:
@@ -38,6 +90,12 @@ class Meeting:
     @property
     def title(self) -> Optional[str]:
         """Get the meeting title."""
+        if self._title is _UNSET:
+            self._title = self._find_title()
+        return self._title
+
+    def _find_title(self) -> Optional[str]:
+        """Extract the meeting title from the raw data."""
         # Try different possible title fields
         for title_field in ['title', 'name', 'subject', 'meeting_name', 'summary']:
             if title_field in self._data:
@@ -47,6 +105,12 @@ class Meeting:
     @property
     def start_time(self) -> Optional[datetime.datetime]:
         """Get the meeting start time in CST."""
+        if self._start_time is _UNSET:
+            self._start_time = self._find_start_time()
+        return self._start_time
+
+    def _find_start_time(self) -> Optional[datetime.datetime]:
+        """Extract the meeting start time from the raw data."""
         # Try different possible start time fields
         for time_field in ['start_time', 'startTime', 'created_at', 'timestamp', 'date']:
             if time_field in self._data:
@@ -69,24 +133,9 @@ class Meeting:
     @property
     def end_time(self) -> Optional[datetime.datetime]:
         """Get the meeting end time in CST."""
-        # Try different possible end time fields
-        for time_field in ['end_time', 'endTime', 'finished_at']:
-            if time_field in self._data:
-                try:
-                    return convert_utc_to_cst(self._data[time_field])
-                except (ValueError, TypeError):
-                    continue
-
-        # Handle Google Calendar format: end.dateTime
-        if 'end' in self._data and isinstance(self._data['end'], dict):
-            end_data = self._data['end']
-            if 'dateTime' in end_data:
-                try:
-                    return convert_utc_to_cst(end_data['dateTime'])
-                except (ValueError, TypeError):
-                    pass
-
-        return None
+        if self._end_time is _UNSET:
+            self._end_time = extract_end_time(self._data)
+        return self._end_time
 
     @property
     def duration(self) -> Optional[datetime.timedelta]:
@@ -251,7 +300,9 @@ class Meeting:
     @property
     def transcript(self) -> Optional[Transcript]:
         """Get the meeting transcript."""
-        if self._transcript is None:
+        if self._transcript is _UNSET:
+            self._transcript = None
+
             # Try to find transcript data
             transcript_data = None
 
@@ -7,7 +7,7 @@ with double JSON parsing and proper error handling.
 
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from ..utils.config import get_cache_path, validate_cache_path
 
 
@@ -109,6 +109,30 @@ class GranolaParser:
         Returns:
             List[Dict[str, Any]]: List of meeting objects (combined documents and metadata)
 
+        Raises:
+            GranolaParseError: If cache cannot be loaded or meetings not found
+        """
+        meetings = list(self.iter_meetings(debug=debug))
+
+        if debug:
+            print(f"DEBUG: Successfully created {len(meetings)} combined meeting objects")
+
+        return meetings
+
+    def iter_meetings(self, debug: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over meetings from the cache one at a time.
+
+        Each meeting is combined with its metadata, transcript, panels and
+        folder as it is yielded, so callers that filter or stop early never
+        build the full list.
+
+        Args:
+            debug: If True, print debug information about cache structure
+
+        Yields:
+            Dict[str, Any]: Meeting object (combined documents and metadata)
+
         Raises:
             GranolaParseError: If cache cannot be loaded or meetings not found
         """
@@ -163,7 +187,6 @@ class GranolaParser:
                 }
 
         # Combine documents with their metadata, transcripts, and panels
-        meetings = []
         for doc_id, doc_data in documents.items():
             # Start with document data
             meeting = doc_data.copy()
@@ -213,12 +236,7 @@ class GranolaParser:
                 meeting['folder_name'] = None
                 meeting['folder_id'] = None
 
-            meetings.append(meeting)
-
-        if debug:
-            print(f"DEBUG: Successfully created {len(meetings)} combined meeting objects")
-
-        return meetings
+            yield meeting
 
     def get_meeting_by_id(self, meeting_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -12,52 +12,205 @@ Usage:
     python email_on_complete.py              # Normal run
     python email_on_complete.py --dry-run    # List meetings without processing
     python email_on_complete.py --force ID   # Force process a specific meeting
+    python email_on_complete.py --ignore-mtime  # Scan even if the cache is unchanged
 """
 
+from __future__ import annotations
+
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, FrozenSet, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; the stdlib json module is used when unavailable
+    orjson = None
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from granola_mcp.core.parser import GranolaParser
-from granola_mcp.core.meeting import Meeting
-from granola_mcp.cli.formatters.markdown import export_meeting_to_markdown
+# Only lightweight modules are imported up front; the parser, meeting model
+# and markdown formatter are imported where used, after the unchanged-cache
+# fast path, so idle launchd ticks don't pay for them.
 from granola_mcp.utils.config import load_config, get_cache_path
 
+if TYPE_CHECKING:
+    from granola_mcp.core.meeting import Meeting
+    from granola_mcp.core.parser import GranolaParser
+
 # Configuration
 STATE_FILE = Path.home() / ".granola_email_state.json"
+STATE_LOG_FILE = Path.home() / ".granola_email_state.log"
+STATE_LOG_COMPACT_LINES = 1000
+# Per-run bookkeeping used by the unchanged-cache fast path
+RUN_STATE_KEYS = ("last_run", "last_cache_mtime", "next_end_epoch", "retry_pending")
 EXPORT_DIR = Path.home() / "Documents/03-Knowledge-Base/meetings"
+MARKDOWN_CACHE_DIR = Path.home() / ".granola_email_cache"
+MARKDOWN_CACHE_MAX_AGE_DAYS = 7
+EXPORT_FOOTER_PREFIX = "\n*Exported on "  # Footer stamped by export_meeting_to_markdown
 LOOKBACK_MINUTES = 30
 TIMEZONE = ZoneInfo("America/Chicago")
+SES_MAX_WORKERS = 10
+SES_MAX_POOL_CONNECTIONS = 32
+SES_DEFAULT_SEND_RATE = 14.0  # Messages per second if the quota lookup fails
+SES_TEMPLATE_NAME = "GranolaMeeting"
+SES_BULK_MAX_DESTINATIONS = 50  # SES limit per SendBulkTemplatedEmail call
+SES_BULK_MIN_DESTINATIONS = 3  # Smaller batches are sent individually
+
+_ses_client = None
+_ses_client_lock = threading.Lock()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode compact, newline-terminated JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode("utf-8")
+
 
+def load_state(dry_run: bool = False) -> dict:
+    """
+    Load the state tracking emailed and exported meetings.
+
+    The JSON state file holds a compacted snapshot; IDs and run records
+    written since then live in the append-only STATE_LOG_FILE and are
+    replayed on top of it. Lines that fail to parse (e.g. a torn write) are
+    skipped individually. Once the log grows past STATE_LOG_COMPACT_LINES it
+    is folded back into the snapshot, except in dry-run mode.
+    """
+    state = {"emailed_ids": set(), "exported_ids": set()}
+    state.update(dict.fromkeys(RUN_STATE_KEYS))
 
-def load_state() -> dict:
-    """Load the state file tracking emailed and exported meetings."""
     if STATE_FILE.exists():
         try:
-            with open(STATE_FILE, "r") as f:
-                state = json.load(f)
-                # Ensure exported_ids exists for backwards compatibility
-                if "exported_ids" not in state:
-                    state["exported_ids"] = []
-                return state
-        except (json.JSONDecodeError, IOError):
+            with open(STATE_FILE, "rb") as f:
+                saved = _json_loads(f.read())
+            state["emailed_ids"] = set(saved.get("emailed_ids", []))
+            # exported_ids may be missing from older state files
+            state["exported_ids"] = set(saved.get("exported_ids", []))
+            for key in RUN_STATE_KEYS:
+                state[key] = saved.get(key)
+        except (ValueError, IOError):
+            # JSONDecodeError (stdlib and orjson) subclasses ValueError
             pass
-    return {"emailed_ids": [], "exported_ids": [], "last_run": None}
+
+    log_lines = 0
+    if STATE_LOG_FILE.exists():
+        try:
+            with open(STATE_LOG_FILE, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    log_lines += 1
+                    kind, _, value = line.strip().partition(" ")
+                    if kind == "run":
+                        # Latest run record wins; skip a torn or corrupt record
+                        try:
+                            run_info = _json_loads(value)
+                        except ValueError:
+                            continue
+                        if isinstance(run_info, dict):
+                            for key in RUN_STATE_KEYS:
+                                state[key] = run_info.get(key)
+                        continue
+                    key = f"{kind}_ids"
+                    if value and key in ("emailed_ids", "exported_ids"):
+                        state[key].add(value)
+        except IOError:
+            pass
+
+    if log_lines > STATE_LOG_COMPACT_LINES and not dry_run:
+        try:
+            save_state(state)
+        except OSError as e:
+            # The log still holds everything; compaction is retried next run
+            print(f"WARNING: Failed to compact state file: {e}", file=sys.stderr)
+
+    return state
 
 
 def save_state(state: dict) -> None:
-    """Save the state file."""
-    state["last_run"] = datetime.now(TIMEZONE).isoformat()
-    with open(STATE_FILE, "w") as f:
-        json.dump(state, f, indent=2)
+    """Write a compacted snapshot of the state file and truncate the log."""
+    snapshot = {
+        # Sorted for deterministic, diff-friendly file contents
+        "emailed_ids": sorted(state["emailed_ids"]),
+        "exported_ids": sorted(state["exported_ids"]),
+    }
+    for key in RUN_STATE_KEYS:
+        snapshot[key] = state.get(key)
+
+    tmp_path = STATE_FILE.with_name(STATE_FILE.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_json_dumps(snapshot))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, STATE_FILE)
+
+    # The snapshot now covers everything in the log
+    with open(STATE_LOG_FILE, "w"):
+        pass
+
+
+def append_state_log(emailed: List[str], exported: List[str], run_info: Optional[dict] = None) -> None:
+    """Durably record newly processed meeting IDs (and run info) in the append-only log."""
+    lines = [f"emailed {mid}\n" for mid in emailed] + [f"exported {mid}\n" for mid in exported]
+    if run_info is not None:
+        lines.append("run " + _json_dumps(run_info).decode("utf-8"))
+    if not lines:
+        return
+
+    with open(STATE_LOG_FILE, "a+b") as f:
+        # Start on a fresh line in case a previous write was torn mid-line
+        prefix = ""
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                prefix = "\n"
+        f.write((prefix + "".join(lines)).encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def record_run(state: dict, cache_mtime: float, next_end_epoch: Optional[float], retry_pending: bool) -> None:
+    """Record a completed run so the next tick can skip work if the cache is unchanged."""
+    run_info = {
+        "last_run": datetime.now(TIMEZONE).isoformat(),
+        "last_cache_mtime": cache_mtime,
+        "next_end_epoch": next_end_epoch,
+        "retry_pending": retry_pending,
+    }
+    append_state_log([], [], run_info)
+    state.update(run_info)
+
+
+def can_skip_run(state: dict, cache_mtime: float, now_epoch: float) -> bool:
+    """
+    Check whether a run can exit early because nothing could have changed.
+
+    Requires an unchanged cache mtime (compared against the recorded mtime,
+    not last_run, so clock skew doesn't matter), no failed sends/exports left
+    to retry, and no known meeting whose end time has since been reached.
+    """
+    if state.get("last_cache_mtime") != cache_mtime or state.get("retry_pending"):
+        return False
+
+    next_end_epoch = state.get("next_end_epoch")
+    return next_end_epoch is None or now_epoch < next_end_epoch
 
 
 def get_email_config() -> dict:
@@ -73,38 +226,67 @@ def get_email_config() -> dict:
     }
 
 
-def should_email_meeting(meeting: Meeting, emailed_ids: list, cutoff_time: datetime) -> bool:
+def _scan_end_times(parser: GranolaParser, lo: float, hi: float) -> Tuple[List[Meeting], Optional[float]]:
+    """
+    Find meetings whose end time falls within [lo, hi] (Unix epochs).
+
+    Raw meetings are streamed from the parser in a single linear pass and
+    filtered on their end time before any Meeting object is built; only the
+    matches are kept. The earliest end time after `hi` is tracked as well,
+    so the unchanged-cache fast path knows when a known meeting will enter
+    the window.
+
+    Returns:
+        Tuple of (matching meetings ordered by end time, next end epoch after hi or None)
+    """
+    from granola_mcp.core.meeting import Meeting, extract_end_time
+
+    matches = []
+    next_end_epoch = None
+    for meeting_data in parser.iter_meetings():
+        end_time = extract_end_time(meeting_data)
+        if end_time is None:
+            continue
+        end_epoch = end_time.timestamp()
+        if end_epoch < lo:
+            continue
+        if end_epoch <= hi:
+            matches.append((end_epoch, meeting_data))
+        elif next_end_epoch is None or end_epoch < next_end_epoch:
+            next_end_epoch = end_epoch
+
+    matches.sort(key=lambda match: match[0])
+    return [Meeting(meeting_data) for _, meeting_data in matches], next_end_epoch
+
+
+def should_email_meeting(meeting: Meeting, emailed_ids: FrozenSet[str], cutoff_epoch: float,
+                         now_epoch: float) -> bool:
     """
     Determine if a meeting should be emailed.
 
-    Criteria:
-    - Has an end time in the past
-    - End time is within the lookback window
+    Checks run cheapest first:
+    - Not already emailed (set membership)
+    - End time within [cutoff_epoch, now_epoch] (float comparison)
     - Has transcript data
-    - Not already emailed
+
+    Meetings from _scan_end_times() already satisfy the window, so
+    the window check is a cheap guard for other callers.
     """
-    if meeting.id in emailed_ids:
-        return False
+    # A list here would make the membership test O(n) per meeting
+    assert isinstance(emailed_ids, frozenset), "emailed_ids must be a frozenset"
 
-    if not meeting.has_transcript():
+    if meeting.id in emailed_ids:
         return False
 
     end_time = meeting.end_time
     if end_time is None:
         return False
 
-    # Ensure end_time is timezone-aware for comparison
-    if end_time.tzinfo is None:
-        end_time = end_time.replace(tzinfo=TIMEZONE)
-
-    now = datetime.now(TIMEZONE)
-
-    # Meeting must have ended
-    if end_time > now:
+    # Meeting must have ended, within the lookback window
+    if not cutoff_epoch <= end_time.timestamp() <= now_epoch:
         return False
 
-    # Meeting must have ended after cutoff (within lookback window)
-    if end_time < cutoff_time:
+    if not meeting.has_transcript():
         return False
 
     return True
@@ -119,6 +301,86 @@ def format_email_subject(meeting: Meeting) -> str:
     return f"Granola Meeting: {title} - {date_str}"
 
 
+def _refresh_export_footer(content: str) -> str:
+    """Replace the "*Exported on ...*" footer of a cached render with the current time."""
+    head, sep, _ = content.rpartition(EXPORT_FOOTER_PREFIX)
+    if not sep:
+        return content
+    return f"{head}{EXPORT_FOOTER_PREFIX}{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
+
+
+def render_email_body(meeting: Meeting, rendered: Optional[str] = None) -> str:
+    """
+    Get a meeting's markdown email body, reusing a previously rendered copy if present.
+
+    Email bodies are cached in MARKDOWN_CACHE_DIR, keyed by meeting ID plus a
+    short hash of its end/update timestamps so edited meetings are re-rendered.
+    A cache hit gets a fresh "Exported on" footer. Writing a new entry prunes
+    the meeting's stale digests and any entry older than
+    MARKDOWN_CACHE_MAX_AGE_DAYS.
+
+    Args:
+        meeting: Meeting to render
+        rendered: Markdown already rendered for this meeting in the current
+            run (e.g. by the file export); cached and returned as-is
+    """
+    from granola_mcp.cli.formatters.markdown import export_meeting_to_markdown
+
+    if not meeting.id:
+        return rendered if rendered is not None else export_meeting_to_markdown(meeting)
+
+    key = f"{meeting.id}|{meeting.end_time}|{meeting.get_field('updated_at')}"
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    slug = sanitize_filename(meeting.id)
+    cache_file = MARKDOWN_CACHE_DIR / f"{slug}-{digest}.md"
+
+    if rendered is not None:
+        content = rendered
+    else:
+        try:
+            return _refresh_export_footer(cache_file.read_text(encoding="utf-8"))
+        except OSError:
+            pass
+
+        content = export_meeting_to_markdown(meeting)
+
+    # Write atomically so a concurrent or interrupted run never sees a partial file
+    try:
+        import tempfile
+
+        MARKDOWN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=MARKDOWN_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"  WARNING: Failed to cache rendered markdown: {e}", file=sys.stderr)
+    else:
+        _prune_markdown_cache(slug, keep=cache_file)
+
+    return content
+
+
+def _prune_markdown_cache(slug: str, keep: Path) -> None:
+    """Remove superseded digests for a meeting and entries past the age limit."""
+    # Match the exact "<slug>-<16 hex digest>.md" shape so "abc" never matches "abc-def-..."
+    stale_pattern = f"{slug}-" + "[0-9a-f]" * 16 + ".md"
+    cutoff = time.time() - MARKDOWN_CACHE_MAX_AGE_DAYS * 86400
+
+    for path in MARKDOWN_CACHE_DIR.glob("*.md"):
+        if path == keep:
+            continue
+        try:
+            if path.match(stale_pattern) or path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
 def sanitize_filename(name: str) -> str:
     """Convert meeting title to filesystem-safe slug."""
     slug = name.lower().strip()
@@ -127,8 +389,17 @@ def sanitize_filename(name: str) -> str:
     return slug[:50]  # Limit length
 
 
-def save_transcript_to_file(meeting: Meeting) -> bool:
-    """Save meeting transcript as markdown file to knowledge base."""
+def save_transcript_to_file(meeting: Meeting) -> Optional[str]:
+    """
+    Save meeting transcript as markdown file to knowledge base.
+
+    Always renders fresh (never from the email body cache).
+
+    Returns:
+        The rendered markdown on success, None on failure
+    """
+    from granola_mcp.cli.formatters.markdown import export_meeting_to_markdown
+
     try:
         EXPORT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -142,23 +413,82 @@ def save_transcript_to_file(meeting: Meeting) -> bool:
 
         filepath.write_text(content, encoding="utf-8")
         print(f"  Saved to: {filepath}")
-        return True
+        return content
     except Exception as e:
         print(f"  ERROR: Failed to save transcript: {e}", file=sys.stderr)
-        return False
+        return None
+
+
+def get_ses_client(region: str):
+    """
+    Get the shared SES client, creating it on first use.
+
+    boto3 clients are thread-safe, so a single client (and its HTTPS
+    connection pool) is reused across all sends in this process.
+
+    Raises:
+        ImportError: If boto3 is not installed
+    """
+    global _ses_client
+    with _ses_client_lock:
+        if _ses_client is None:
+            import boto3
+            from botocore.config import Config
+
+            _ses_client = boto3.client(
+                "ses",
+                region_name=region,
+                config=Config(
+                    max_pool_connections=SES_MAX_POOL_CONNECTIONS,
+                    retries={"max_attempts": 3, "mode": "adaptive"},
+                ),
+            )
+    return _ses_client
+
+
+class RateLimiter:
+    """Token bucket that spaces calls to at most `rate` per second across threads."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until the caller may issue the next call."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def get_ses_send_rate(client) -> float:
+    """Get the account's SES send rate (messages/second), with a safe default."""
+    try:
+        rate = float(client.get_send_quota().get("MaxSendRate", 0))
+    except Exception:
+        rate = 0.0
+    return rate if rate > 0 else SES_DEFAULT_SEND_RATE
 
 
-def send_email_ses(to_addr: str, from_addr: str, subject: str, body: str, region: str) -> bool:
+def send_email_ses(to_addr: str, from_addr: str, subject: str, body: str, region: str,
+                   rate_limiter: Optional[RateLimiter] = None) -> bool:
     """Send email via AWS SES."""
     try:
-        import boto3
+        client = get_ses_client(region)
         from botocore.exceptions import ClientError
     except ImportError:
         print("ERROR: boto3 not installed. Run: pip install boto3", file=sys.stderr)
         return False
+    except Exception as e:
+        print(f"  ERROR: Failed to create SES client: {e}", file=sys.stderr)
+        return False
 
     try:
-        client = boto3.client("ses", region_name=region)
+        if rate_limiter is not None:
+            rate_limiter.acquire()
 
         response = client.send_email(
             Source=from_addr,
@@ -170,23 +500,185 @@ def send_email_ses(to_addr: str, from_addr: str, subject: str, body: str, region
         )
 
         message_id = response.get("MessageId", "unknown")
-        print(f"  Email sent successfully (MessageId: {message_id})")
+        print(f"  Email sent successfully: {subject} (MessageId: {message_id})")
         return True
 
     except ClientError as e:
         error_code = e.response.get("Error", {}).get("Code", "Unknown")
         error_msg = e.response.get("Error", {}).get("Message", str(e))
-        print(f"  ERROR: SES send failed ({error_code}): {error_msg}", file=sys.stderr)
+        print(f"  ERROR: SES send failed for {subject} ({error_code}): {error_msg}", file=sys.stderr)
         return False
     except Exception as e:
-        print(f"  ERROR: Failed to send email: {e}", file=sys.stderr)
+        print(f"  ERROR: Failed to send email {subject}: {e}", file=sys.stderr)
         return False
 
 
-def process_meetings(dry_run: bool = False, force_id: str = None) -> int:
+def send_emails_parallel(emails: List[Tuple[str, str, str]], email_config: dict) -> List[str]:
+    """
+    Send a batch of emails concurrently over the shared SES client.
+
+    Sends are network-bound, so they are fanned out across a thread pool and
+    throttled to the account's SES send rate.
+
+    Args:
+        emails: List of (meeting_id, subject, body) tuples
+        email_config: Email configuration from get_email_config()
+
+    Returns:
+        List of meeting IDs whose email was sent successfully
+    """
+    if not emails:
+        return []
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        rate_limiter = RateLimiter(get_ses_send_rate(get_ses_client(email_config["region"])))
+    except ImportError:
+        print("ERROR: boto3 not installed. Run: pip install boto3", file=sys.stderr)
+        return []
+    except Exception as e:
+        print(f"  ERROR: Failed to create SES client: {_describe_ses_error(e)}", file=sys.stderr)
+        return []
+
+    def send_one(email: Tuple[str, str, str]) -> Tuple[str, bool]:
+        meeting_id, subject, body = email
+        success = send_email_ses(
+            to_addr=email_config["to"],
+            from_addr=email_config["from"],
+            subject=subject,
+            body=body,
+            region=email_config["region"],
+            rate_limiter=rate_limiter,
+        )
+        return meeting_id, success
+
+    with ThreadPoolExecutor(max_workers=min(len(emails), SES_MAX_WORKERS)) as executor:
+        results = list(executor.map(send_one, emails))
+
+    return [meeting_id for meeting_id, success in results if success]
+
+
+def _describe_ses_error(e: Exception) -> str:
+    """Format an SES failure: ClientError code/message, or any other exception as-is."""
+    error = getattr(e, "response", {}).get("Error", {})
+    if error:
+        return f"{error.get('Code', 'Unknown')}: {error.get('Message', str(e))}"
+    return f"{type(e).__name__}: {e}"
+
+
+def _ensure_ses_template(client, name: str = SES_TEMPLATE_NAME) -> None:
+    """Register the meeting email template with SES if it does not already exist."""
+    from botocore.exceptions import ClientError
+
+    try:
+        client.create_template(
+            Template={
+                "TemplateName": name,
+                # Triple braces: insert subject/body verbatim, without HTML escaping
+                "SubjectPart": "{{{subject}}}",
+                "TextPart": "{{{body}}}",
+            }
+        )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "AlreadyExists":
+            raise
+
+
+def send_emails_bulk(emails: List[Tuple[str, str, str]], email_config: dict) -> List[str]:
+    """
+    Send a batch of emails with SendBulkTemplatedEmail.
+
+    Amortizes the HTTPS round-trip across up to SES_BULK_MAX_DESTINATIONS
+    messages per API call. Batches smaller than SES_BULK_MIN_DESTINATIONS
+    (the common tick) gain nothing from this and go through
+    send_emails_parallel() instead. The template is only registered when SES
+    reports it missing, so steady-state batches cost one call per chunk.
+    Chunks whose bulk call fails outright fall back to send_emails_parallel().
+
+    Args:
+        emails: List of (meeting_id, subject, body) tuples
+        email_config: Email configuration from get_email_config()
+
+    Returns:
+        List of meeting IDs whose email was sent successfully
+    """
+    if len(emails) < SES_BULK_MIN_DESTINATIONS:
+        return send_emails_parallel(emails, email_config)
+
+    try:
+        client = get_ses_client(email_config["region"])
+    except ImportError:
+        print("ERROR: boto3 not installed. Run: pip install boto3", file=sys.stderr)
+        return []
+    except Exception as e:
+        print(f"  ERROR: Failed to create SES client: {_describe_ses_error(e)}", file=sys.stderr)
+        return []
+
+    def send_chunk(chunk: List[Tuple[str, str, str]]) -> dict:
+        return client.send_bulk_templated_email(
+            Source=email_config["from"],
+            Template=SES_TEMPLATE_NAME,
+            DefaultTemplateData=json.dumps({"subject": "", "body": ""}),
+            Destinations=[
+                {
+                    "Destination": {"ToAddresses": [email_config["to"]]},
+                    "ReplacementTemplateData": json.dumps({"subject": subject, "body": body}),
+                }
+                for _, subject, body in chunk
+            ],
+        )
+
+    sent_ids = []
+    fallback = []
+    template_registered = False
+
+    for start in range(0, len(emails), SES_BULK_MAX_DESTINATIONS):
+        chunk = emails[start:start + SES_BULK_MAX_DESTINATIONS]
+
+        # Any failure (ClientError, or BotoCoreError such as NoCredentialsError or
+        # EndpointConnectionError) falls back rather than aborting the run, so
+        # IDs already sent and exports already written still get recorded.
+        try:
+            try:
+                response = send_chunk(chunk)
+            except Exception as e:
+                error_code = getattr(e, "response", {}).get("Error", {}).get("Code")
+                if error_code != "TemplateDoesNotExist" or template_registered:
+                    raise
+                _ensure_ses_template(client)
+                template_registered = True
+                response = send_chunk(chunk)
+        except Exception as e:
+            print(f"  WARNING: SES bulk send failed ({_describe_ses_error(e)})", file=sys.stderr)
+            fallback.extend(chunk)
+            continue
+
+        # Status entries are returned in the same order as Destinations
+        statuses = response.get("Status", [])
+        for index, (meeting_id, subject, _) in enumerate(chunk):
+            status = statuses[index] if index < len(statuses) else {"Error": "no status returned by SES"}
+            if status.get("Status") == "Success":
+                print(f"  Email sent successfully: {subject} (MessageId: {status.get('MessageId', 'unknown')})")
+                sent_ids.append(meeting_id)
+            else:
+                error = status.get("Error") or status.get("Status", "Unknown")
+                print(f"  ERROR: SES send failed for {subject}: {error}", file=sys.stderr)
+
+    if fallback:
+        sent_ids.extend(send_emails_parallel(fallback, email_config))
+
+    return sent_ids
+
+
+def process_meetings(dry_run: bool = False, force_id: str = None, ignore_mtime: bool = False) -> int:
     """
     Main processing logic.
 
+    Exits early when the cache file is unchanged since the last run (see
+    can_skip_run), unless forcing a meeting, doing a dry run, or
+    ignore_mtime is set.
+
     Returns:
         Number of meetings processed (emailed + exported)
     """
@@ -195,47 +687,71 @@ def process_meetings(dry_run: bool = False, force_id: str = None) -> int:
     email_config = get_email_config()
 
     # Load state
-    state = load_state()
-    emailed_ids = set(state.get("emailed_ids", []))
-    exported_ids = set(state.get("exported_ids", []))
+    state = load_state(dry_run=dry_run)
+    emailed_ids = state["emailed_ids"]
+    exported_ids = state["exported_ids"]
 
-    # Calculate cutoff time
+    # Calculate the lookback window once, as epochs for cheap comparisons
     now = datetime.now(TIMEZONE)
     cutoff_time = now - timedelta(minutes=LOOKBACK_MINUTES)
+    now_epoch = now.timestamp()
+    cutoff_epoch = cutoff_time.timestamp()
+
+    cache_path = get_cache_path(config)
+    try:
+        cache_mtime = os.stat(cache_path).st_mtime
+    except OSError:
+        cache_mtime = None
+
+    # Fast path: nothing to do if the cache hasn't changed since the last run
+    if not force_id and not dry_run and not ignore_mtime and cache_mtime is not None:
+        if can_skip_run(state, cache_mtime, now_epoch):
+            print(f"No cache changes since {state.get('last_run')}")
+            return 0
+
+    # Whether to record this run for the fast path (normal, non-dry runs only)
+    track_run = not force_id and not dry_run and cache_mtime is not None
+
+    from granola_mcp.core.parser import GranolaParser
+    from granola_mcp.core.meeting import Meeting
 
     # Load meetings
+    next_end_epoch = None
     try:
-        cache_path = get_cache_path(config)
         parser = GranolaParser(cache_path)
-        meetings_data = parser.get_meetings()
+        if force_id:
+            # Force mode: stream meetings and stop at the first match
+            meetings = []
+            for meeting_data in parser.iter_meetings():
+                meeting = Meeting(meeting_data)
+                if meeting.id and meeting.id.startswith(force_id):
+                    meetings.append(meeting)
+                    break
+        else:
+            # Only meetings that ended within the lookback window
+            meetings, next_end_epoch = _scan_end_times(parser, cutoff_epoch, now_epoch)
     except Exception as e:
         print(f"ERROR: Failed to load Granola cache: {e}", file=sys.stderr)
         return 0
 
-    # Convert to Meeting objects
-    meetings = [Meeting(m) for m in meetings_data]
-
     # Find meetings to process (either export or email)
-    to_process = []
-
     if force_id:
-        # Force mode: find specific meeting
-        for meeting in meetings:
-            if meeting.id and meeting.id.startswith(force_id):
-                to_process.append(meeting)
-                break
+        to_process = meetings
         if not to_process:
             print(f"ERROR: Meeting not found: {force_id}", file=sys.stderr)
             return 0
     else:
         # Normal mode: find recently completed meetings not yet processed
-        processed_ids = emailed_ids & exported_ids  # Both done
-        for meeting in meetings:
-            if should_email_meeting(meeting, processed_ids, cutoff_time):
-                to_process.append(meeting)
+        processed_ids = frozenset(emailed_ids & exported_ids)  # Both done
+        to_process = [
+            meeting for meeting in meetings
+            if should_email_meeting(meeting, processed_ids, cutoff_epoch, now_epoch)
+        ]
 
     if not to_process:
-        print(f"No new meetings to process (checked {len(meetings)} meetings)")
+        print(f"No new meetings to process (checked {len(meetings)} recently ended meetings)")
+        if track_run:
+            record_run(state, cache_mtime, next_end_epoch, False)
         return 0
 
     print(f"Found {len(to_process)} meeting(s) to process:")
@@ -244,10 +760,12 @@ def process_meetings(dry_run: bool = False, force_id: str = None) -> int:
     export_count = 0
     newly_emailed = []
     newly_exported = []
+    pending_emails = []
 
     for meeting in to_process:
         title = meeting.title or "Untitled"
         meeting_id = meeting.id or "unknown"
+        subject = format_email_subject(meeting)
 
         print(f"\n  [{meeting_id[:8]}] {title}")
 
@@ -257,45 +775,53 @@ def process_meetings(dry_run: bool = False, force_id: str = None) -> int:
             print(f"    Has transcript: {meeting.has_transcript()}")
             print(f"    Would export to: {EXPORT_DIR}")
             if email_config["enabled"]:
-                print(f"    Would email: {format_email_subject(meeting)}")
+                print(f"    Would email: {subject}")
             sent_count += 1
             export_count += 1
         else:
             # Export transcript to file (always)
+            exported_content = None
             if meeting_id not in exported_ids:
-                if save_transcript_to_file(meeting):
+                exported_content = save_transcript_to_file(meeting)
+                if exported_content is not None:
                     export_count += 1
                     newly_exported.append(meeting_id)
 
-            # Send email (if enabled and configured)
+            # Queue email (if enabled and configured)
             if email_config["enabled"] and meeting_id not in emailed_ids:
                 if not email_config["to"] or not email_config["from"]:
                     print("  Skipping email: EMAIL_TO or EMAIL_FROM not configured")
                 else:
-                    subject = format_email_subject(meeting)
-                    body = export_meeting_to_markdown(meeting)
-
-                    success = send_email_ses(
-                        to_addr=email_config["to"],
-                        from_addr=email_config["from"],
-                        subject=subject,
-                        body=body,
-                        region=email_config["region"],
-                    )
-
-                    if success:
-                        sent_count += 1
-                        newly_emailed.append(meeting_id)
+                    # Reuse this run's export render rather than rendering twice
+                    body = render_email_body(meeting, rendered=exported_content)
+                    pending_emails.append((meeting_id, subject, body))
+
+    # Send queued emails: one bulk call per chunk normally, a single send when forced
+    if pending_emails:
+        print(f"\nSending {len(pending_emails)} email(s)...")
+        if force_id:
+            newly_emailed = send_emails_parallel(pending_emails, email_config)
+        else:
+            newly_emailed = send_emails_bulk(pending_emails, email_config)
+        sent_count += len(newly_emailed)
 
     # Update state
     if (newly_emailed or newly_exported) and not dry_run:
-        if newly_emailed:
-            state["emailed_ids"] = list(emailed_ids | set(newly_emailed))
-        if newly_exported:
-            state["exported_ids"] = list(exported_ids | set(newly_exported))
-        save_state(state)
+        append_state_log(newly_emailed, newly_exported)
+        emailed_ids.update(newly_emailed)
+        exported_ids.update(newly_exported)
         print(f"\nState updated: {len(newly_exported)} exported, {len(newly_emailed)} emailed")
 
+    if track_run:
+        # Anything that failed this run must be retried even if the cache is unchanged
+        email_wanted = email_config["enabled"] and email_config["to"] and email_config["from"]
+        retry_pending = any(
+            (meeting.id or "unknown") not in exported_ids
+            or (email_wanted and (meeting.id or "unknown") not in emailed_ids)
+            for meeting in to_process
+        )
+        record_run(state, cache_mtime, next_end_epoch, retry_pending)
+
     return export_count + sent_count
 
 
@@ -313,13 +839,18 @@ def main():
         metavar="MEETING_ID",
         help="Force process a specific meeting (partial ID match)",
     )
+    parser.add_argument(
+        "--ignore-mtime",
+        action="store_true",
+        help="Scan the cache even if it is unchanged since the last run",
+    )
 
     args = parser.parse_args()
 
     print(f"Granola Meeting Automation - {datetime.now(TIMEZONE).strftime('%Y-%m-%d %H:%M:%S')}")
     print("-" * 60)
 
-    count = process_meetings(dry_run=args.dry_run, force_id=args.force)
+    count = process_meetings(dry_run=args.dry_run, force_id=args.force, ignore_mtime=args.ignore_mtime)
 
     if args.dry_run:
         print(f"\n[DRY RUN] Would process {count} action(s)")